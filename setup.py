@@ -1,5 +1,24 @@
+import os
+
 from setuptools import find_packages, setup
 
+# Opt-in ahead-of-time compilation of the parsing hot path with mypyc (shipped
+# with mypy). The default build stays pure Python; the .py sources are packaged
+# either way so imports fall back cleanly when the extensions are missing.
+# parser.py and tokens.py rely on custom metaclasses, which mypyc can't
+# compile, so only the metaclass-free leaf modules are included.
+if os.environ.get("SQLGLOT_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "sqlglot/trie.py",
+            "sqlglot/time.py",
+        ]
+    )
+else:
+    ext_modules = []
+
 version = (
     open("sqlglot/__init__.py")
     .read()
@@ -22,6 +41,7 @@ setup(
     license="MIT",
     packages=find_packages(include=["sqlglot", "sqlglot.*"]),
     package_data={"sqlglot": ["py.typed"]},
+    ext_modules=ext_modules,
     extras_require={
         "dev": [
             "autoflake",
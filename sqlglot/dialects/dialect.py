@@ -122,6 +122,9 @@ class Dialect(metaclass=_Dialect):
     parser_class = None
     generator_class = None
 
+    # Lazily cached by parser for option-less calls
+    _parser: Parser
+
     @classmethod
     def get_or_raise(cls, dialect: DialectType) -> t.Type[Dialect]:
         if not dialect:
@@ -180,7 +183,12 @@ class Dialect(metaclass=_Dialect):
         return self._tokenizer
 
     def parser(self, **opts) -> Parser:
-        return self.parser_class(  # type: ignore
+        # Parser.parse resets all per-call state, so calls that don't override
+        # any options can share one instance per dialect, like the tokenizer.
+        if not opts and hasattr(self, "_parser"):
+            return self._parser
+
+        parser = self.parser_class(  # type: ignore
             **{
                 "index_offset": self.index_offset,
                 "unnest_column_only": self.unnest_column_only,
@@ -190,6 +198,11 @@ class Dialect(metaclass=_Dialect):
             },
         )
 
+        if not opts:
+            self._parser = parser
+
+        return parser
+
     def generator(self, **opts) -> Generator:
         return self.generator_class(  # type: ignore
             **{
@@ -435,7 +435,7 @@ class TSQL(Dialect):
             exp.GroupConcat: _string_agg_sql,
         }
 
-        TRANSFORMS.pop(exp.ReturnsProperty)
+        TRANSFORMS.pop(exp.ReturnsProperty)  # type: ignore
 
         def systemtime_sql(self, expression: exp.SystemTime) -> str:
             kind = expression.args["kind"]
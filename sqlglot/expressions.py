@@ -44,6 +44,9 @@ class _Expression(type):
         # the lowercase version of the class' name.
         klass.key = clsname.lower()
 
+        # Precomputed so that validating a node doesn't have to filter arg_types.
+        klass._required_args = tuple(k for k, mandatory in klass.arg_types.items() if mandatory)
+
         # This is so that docstrings are not inherited in pdoc
         klass.__doc__ = klass.__doc__ or ""
 
@@ -84,6 +87,9 @@ class Expression(metaclass=_Expression):
     arg_types = {"this": True}
     __slots__ = ("args", "parent", "arg_key", "comments", "_type")
 
+    # Set by the metaclass to the mandatory arg keys in arg_types
+    _required_args: t.Tuple[str, ...]
+
     def __init__(self, **args: t.Any):
         self.args: t.Dict[str, t.Any] = args
         self.parent: t.Optional[Expression] = None
@@ -91,8 +97,17 @@ class Expression(metaclass=_Expression):
         self.comments: t.Optional[t.List[str]] = None
         self._type: t.Optional[DataType] = None
 
-        for arg_key, value in self.args.items():
-            self._set_parent(arg_key, value)
+        # Inlined _set_parent, as constructing a node is by far the hottest
+        # path in the parser and the method call per arg adds up.
+        for arg_key, value in args.items():
+            if isinstance(value, Expression):
+                value.parent = self
+                value.arg_key = arg_key
+            elif isinstance(value, list):
+                for v in value:
+                    if isinstance(v, Expression):
+                        v.parent = self
+                        v.arg_key = arg_key
 
     def __eq__(self, other) -> bool:
         return type(self) is type(other) and _norm_args(self) == _norm_args(other)
@@ -554,9 +569,9 @@ class Expression(metaclass=_Expression):
         for k in self.args:
             if k not in self.arg_types:
                 errors.append(f"Unexpected keyword: '{k}' for {self.__class__}")
-        for k, mandatory in self.arg_types.items():
+        for k in self._required_args:
             v = self.args.get(k)
-            if mandatory and (v is None or (isinstance(v, list) and not v)):
+            if v is None or (isinstance(v, list) and not v):
                 errors.append(f"Required keyword: '{k}' missing for {self.__class__}")
 
         if (
@@ -35,6 +35,38 @@ class _Parser(type):
         klass = super().__new__(cls, clsname, bases, attrs)
         klass._show_trie = new_trie(key.split(" ") for key in klass.SHOW_PARSERS)
         klass._set_trie = new_trie(key.split(" ") for key in klass.SET_PARSERS)
+
+        # Precedence tables for the climbing loop in _parse_binary, built once per
+        # (dialect) class so that overrides of the operator dicts are picked up.
+        klass._condition_precedence = {
+            **{token_type: (1, exp_class) for token_type, exp_class in klass.CONJUNCTION.items()},
+            **{token_type: (2, exp_class) for token_type, exp_class in klass.EQUALITY.items()},
+            **{token_type: (3, exp_class) for token_type, exp_class in klass.COMPARISON.items()},
+        }
+        klass._arithmetic_precedence = {
+            **{token_type: (1, exp_class) for token_type, exp_class in klass.TERM.items()},
+            **{token_type: (2, exp_class) for token_type, exp_class in klass.FACTOR.items()},
+        }
+
+        # Tokens that can begin a join clause, used to bail out of _parse_join
+        # without probing for the side and kind individually.
+        klass._join_start_tokens = {
+            TokenType.JOIN,
+            TokenType.NATURAL,
+            *klass.JOIN_SIDES,
+            *klass.JOIN_KINDS,
+        }
+
+        # Tokens that can begin an alias, so _parse_alias can bail out with a
+        # single membership test when the next token ends the projection.
+        klass._alias_start_tokens = {
+            TokenType.ALIAS,
+            TokenType.L_PAREN,
+            TokenType.IDENTIFIER,
+            *klass.PLACEHOLDER_PARSERS,
+            *klass.ID_VAR_TOKENS,
+        }
+
         return klass
 
 
@@ -59,6 +91,9 @@ class Parser(metaclass=_Parser):
         null_ordering: Indicates the default null ordering method to use if not explicitly set.
             Options are "nulls_are_small", "nulls_are_large", "nulls_are_last".
             Default: "nulls_are_small"
+        memoize: Caches intermediate parse results keyed by token position (packrat parsing),
+            which can help with backtracking-heavy statements at the cost of extra memory.
+            Default: False
     """
 
     FUNCTIONS: t.Dict[str, t.Callable] = {
@@ -250,7 +285,7 @@ class Parser(metaclass=_Parser):
 
     TRIM_TYPES = {TokenType.LEADING, TokenType.TRAILING, TokenType.BOTH}
 
-    FUNC_TOKENS = {
+    FUNC_TOKENS: t.Set[TokenType] = {
         TokenType.COMMAND,
         TokenType.CURRENT_DATE,
         TokenType.CURRENT_DATETIME,
@@ -349,6 +384,46 @@ class Parser(metaclass=_Parser):
         TokenType.ANTI,
     }
 
+    BRACKET_TOKENS = {
+        TokenType.L_BRACKET,
+        TokenType.L_BRACE,
+    }
+
+    COLON_PLACEHOLDER_TOKENS = {
+        TokenType.NUMBER,
+        TokenType.VAR,
+    }
+
+    FETCH_DIRECTIONS = {
+        TokenType.FIRST,
+        TokenType.NEXT,
+    }
+
+    OFFSET_TOKENS = {
+        TokenType.OFFSET,
+        TokenType.COMMA,
+    }
+
+    ROW_TOKENS = {
+        TokenType.ROW,
+        TokenType.ROWS,
+    }
+
+    SELECT_START_TOKENS = {
+        TokenType.WITH,
+        TokenType.SELECT,
+    }
+
+    WINDOW_SIDES = {
+        TokenType.PRECEDING,
+        TokenType.FOLLOWING,
+    }
+
+    WINDOW_VALUE_TOKENS = {
+        TokenType.UNBOUNDED,
+        TokenType.CURRENT_ROW,
+    }
+
     LAMBDAS = {
         TokenType.ARROW: lambda self, expressions: self.expression(
             exp.Lambda,
@@ -444,17 +519,22 @@ class Parser(metaclass=_Parser):
         TokenType.UPDATE: lambda self: self._parse_update(),
         TokenType.USE: lambda self: self.expression(
             exp.Use,
-            kind=self._match_texts(("ROLE", "WAREHOUSE", "DATABASE", "SCHEMA"))
+            kind=self._match_texts(self.USABLES)
             and exp.Var(this=self._prev.text),
             this=self._parse_table(schema=False),
         ),
     }
 
     UNARY_PARSERS = {
-        TokenType.PLUS: lambda self: self._parse_unary(),  # Unary + is handled as a no-op
         TokenType.NOT: lambda self: self.expression(exp.Not, this=self._parse_equality()),
-        TokenType.TILDA: lambda self: self.expression(exp.BitwiseNot, this=self._parse_unary()),
-        TokenType.DASH: lambda self: self.expression(exp.Neg, this=self._parse_unary()),
+    }
+
+    # Simple prefix operators, folded iteratively in _parse_unary so that a run of
+    # them doesn't recurse one Python frame per operator. None marks a no-op prefix.
+    UNARY_WRAPPERS: t.Dict[TokenType, t.Optional[t.Type[exp.Expression]]] = {
+        TokenType.PLUS: None,  # Unary + is handled as a no-op
+        TokenType.DASH: exp.Neg,
+        TokenType.TILDA: exp.BitwiseNot,
     }
 
     PRIMARY_PARSERS = {
@@ -483,11 +563,11 @@ class Parser(metaclass=_Parser):
         TokenType.PLACEHOLDER: lambda self: self.expression(exp.Placeholder),
         TokenType.PARAMETER: lambda self: self._parse_parameter(),
         TokenType.COLON: lambda self: self.expression(exp.Placeholder, this=self._prev.text)
-        if self._match_set((TokenType.NUMBER, TokenType.VAR))
+        if self._match_set(self.COLON_PLACEHOLDER_TOKENS)
         else None,
     }
 
-    RANGE_PARSERS = {
+    RANGE_PARSERS: t.Dict[TokenType, t.Callable] = {
         TokenType.BETWEEN: lambda self, this: self._parse_between(this),
         TokenType.GLOB: lambda self, this: self._parse_escape(
             self.expression(exp.Glob, this=this, expression=self._parse_bitwise())
@@ -623,6 +703,24 @@ class Parser(metaclass=_Parser):
         "lock": lambda self: self._parse_lock(),
     }
 
+    # Tokens that can begin each query modifier, so that _parse_query_modifiers only
+    # invokes the parsers for clauses that are actually present.
+    QUERY_MODIFIER_TOKENS = {
+        "match": {TokenType.MATCH_RECOGNIZE},
+        "where": {TokenType.WHERE},
+        "group": {TokenType.GROUP_BY},
+        "having": {TokenType.HAVING},
+        "qualify": {TokenType.QUALIFY},
+        "windows": {TokenType.WINDOW},
+        "distribute": {TokenType.DISTRIBUTE_BY},
+        "sort": {TokenType.SORT_BY},
+        "cluster": {TokenType.CLUSTER_BY},
+        "order": {TokenType.ORDER_BY},
+        "limit": {TokenType.LIMIT, TokenType.FETCH},
+        "offset": {TokenType.OFFSET, TokenType.COMMA},
+        "lock": {TokenType.FOR},
+    }
+
     SHOW_PARSERS: t.Dict[str, t.Callable] = {}
     SET_PARSERS: t.Dict[str, t.Callable] = {}
 
@@ -640,12 +738,53 @@ class Parser(metaclass=_Parser):
 
     TRANSACTION_KIND = {"DEFERRED", "IMMEDIATE", "EXCLUSIVE"}
 
+    TRANSACTION_TEXTS = {"TRANSACTION", "WORK"}
+
+    USABLES = {"ROLE", "WAREHOUSE", "DATABASE", "SCHEMA"}
+
+    DATABLOCKSIZE_MIN_TEXTS = {"MIN", "MINIMUM"}
+
+    DATABLOCKSIZE_MAX_TEXTS = {"MAX", "MAXIMUM"}
+
+    DATABLOCKSIZE_UNITS = {"BYTES", "KBYTES", "KILOBYTES"}
+
+    EXCLUSIVE_TEXTS = {"EXCL", "EXCLUSIVE"}
+
+    CREATE_LIKE_TEXTS = {"INCLUDING", "EXCLUDING"}
+
+    TYPE_VALUES_L_TOKENS = {TokenType.L_BRACKET, TokenType.L_PAREN}
+
+    TYPE_VALUES_R_TOKENS = {TokenType.R_BRACKET, TokenType.R_PAREN}
+
+    GENERATED_KIND_TOKENS = {TokenType.AUTO_INCREMENT, TokenType.IDENTITY}
+
+    FOREIGN_KEY_ON_TOKENS = {TokenType.DELETE, TokenType.UPDATE}
+
+    FOREIGN_KEY_SET_TOKENS = {TokenType.NULL, TokenType.DEFAULT}
+
+    TRIM_FROM_TOKENS = {TokenType.FROM, TokenType.COMMA}
+
+    WINDOW_FRAME_TOKENS = {TokenType.ROWS, TokenType.RANGE}
+
     WINDOW_ALIAS_TOKENS = ID_VAR_TOKENS - {TokenType.ROWS}
 
     ADD_CONSTRAINT_TOKENS = {TokenType.CONSTRAINT, TokenType.PRIMARY_KEY, TokenType.FOREIGN_KEY}
 
     STRICT_CAST = True
 
+    # Set by the metaclass from CONJUNCTION/EQUALITY/COMPARISON and TERM/FACTOR
+    _condition_precedence: t.Dict[TokenType, t.Tuple[int, t.Type[exp.Expression]]]
+    _arithmetic_precedence: t.Dict[TokenType, t.Tuple[int, t.Type[exp.Expression]]]
+
+    # Set by the metaclass from JOIN_SIDES and JOIN_KINDS
+    _join_start_tokens: t.Set[TokenType]
+
+    # Set by the metaclass from PLACEHOLDER_PARSERS and ID_VAR_TOKENS
+    _alias_start_tokens: t.Set[TokenType]
+
+    # Packrat memo, keyed by rule name and token index; cleared per statement
+    _memo: t.Dict[t.Tuple[str, int], t.Tuple[t.Optional[exp.Expression], int]]
+
     __slots__ = (
         "error_level",
         "error_message_context",
@@ -656,14 +795,21 @@ class Parser(metaclass=_Parser):
         "alias_post_tablesample",
         "max_errors",
         "null_ordering",
+        "memoize",
+        "_memo",
         "_tokens",
+        "_start",
+        "_end",
         "_index",
         "_curr",
+        "_curr_type",
         "_next",
         "_prev",
         "_prev_comments",
         "_show_trie",
         "_set_trie",
+        "_upper_cache",
+        "_function_cache",
     )
 
     def __init__(
@@ -675,6 +821,7 @@ class Parser(metaclass=_Parser):
         alias_post_tablesample: bool = False,
         max_errors: int = 3,
         null_ordering: t.Optional[str] = None,
+        memoize: bool = False,
     ):
         self.error_level = error_level or ErrorLevel.IMMEDIATE
         self.error_message_context = error_message_context
@@ -683,17 +830,31 @@ class Parser(metaclass=_Parser):
         self.alias_post_tablesample = alias_post_tablesample
         self.max_errors = max_errors
         self.null_ordering = null_ordering
+        self.memoize = memoize
+
+        # These caches only depend on the class-level parser tables, so they
+        # survive reset() and stay warm when an instance is reused, e.g. by the
+        # per-dialect parser that Dialect.parser caches.
+        self._upper_cache: t.Dict[str, str] = {}
+        self._function_cache: t.Dict[
+            str, t.Tuple[t.Optional[t.Callable], t.Optional[t.Callable]]
+        ] = {}
+
         self.reset()
 
     def reset(self):
         self.sql = ""
         self.errors = []
         self._tokens = []
+        self._start = 0
+        self._end = 0
         self._index = 0
         self._curr = None
+        self._curr_type = None
         self._next = None
         self._prev = None
         self._prev_comments = None
+        self._memo = {}
 
     def parse(
         self, raw_tokens: t.List[Token], sql: t.Optional[str] = None
@@ -756,30 +917,42 @@ class Parser(metaclass=_Parser):
         self.reset()
         self.sql = sql or ""
         total = len(raw_tokens)
-        chunks: t.List[t.List[Token]] = [[]]
+        expressions = []
+        start = 0
 
         for i, token in enumerate(raw_tokens):
             if token.token_type == TokenType.SEMICOLON:
-                if i < total - 1:
-                    chunks.append([])
-            else:
-                chunks[-1].append(token)
+                expressions.append(self._parse_chunk(parse_method, raw_tokens, start, i))
+                start = i + 1
 
-        expressions = []
+        if not total or raw_tokens[total - 1].token_type != TokenType.SEMICOLON:
+            expressions.append(self._parse_chunk(parse_method, raw_tokens, start, total))
 
-        for tokens in chunks:
-            self._index = -1
-            self._tokens = tokens
-            self._advance()
+        return expressions
 
-            expressions.append(parse_method(self))
+    def _parse_chunk(
+        self,
+        parse_method: t.Callable[[Parser], t.Optional[exp.Expression]],
+        tokens: t.List[Token],
+        start: int,
+        end: int,
+    ) -> t.Optional[exp.Expression]:
+        # Parses tokens[start:end] in place; the bounds are tracked in _start
+        # and _end instead of slicing a new token list per statement.
+        self._tokens = tokens
+        self._start = start
+        self._end = end
+        self._index = start - 1
+        self._memo.clear()
+        self._advance()
 
-            if self._index < len(self._tokens):
-                self.raise_error("Invalid expression / Unexpected token")
+        expression = parse_method(self)
 
-            self.check_errors()
+        if self._index < self._end:
+            self.raise_error("Invalid expression / Unexpected token")
 
-        return expressions
+        self.check_errors()
+        return expression
 
     def check_errors(self) -> None:
         """
@@ -882,10 +1055,15 @@ class Parser(metaclass=_Parser):
 
     def _advance(self, times: int = 1) -> None:
         self._index += times
-        self._curr = seq_get(self._tokens, self._index)
-        self._next = seq_get(self._tokens, self._index + 1)
-        if self._index > 0:
-            self._prev = self._tokens[self._index - 1]
+        index = self._index
+        tokens = self._tokens
+        size = self._end
+        curr = tokens[index] if index < size else None
+        self._curr = curr
+        self._curr_type = curr.token_type if curr else None
+        self._next = tokens[index + 1] if index + 1 < size else None
+        if index > self._start:
+            self._prev = tokens[index - 1]
             self._prev_comments = self._prev.comments
         else:
             self._prev = None
@@ -898,17 +1076,29 @@ class Parser(metaclass=_Parser):
         return self.expression(exp.Command, this=self._prev.text, expression=self._parse_string())
 
     def _parse_statement(self) -> t.Optional[exp.Expression]:
-        if self._curr is None:
+        curr_type = self._curr_type
+
+        if curr_type is None:
             return None
 
-        if self._match_set(self.STATEMENT_PARSERS):
-            return self.STATEMENT_PARSERS[self._prev.token_type](self)
+        parser = self.STATEMENT_PARSERS.get(curr_type)
+        if parser:
+            self._advance()
+            return parser(self)
 
-        if self._match_set(Tokenizer.COMMANDS):
+        if curr_type in Tokenizer.COMMANDS:
+            self._advance()
             return self._parse_command()
 
-        expression = self._parse_expression()
-        expression = self._parse_set_operations(expression) if expression else self._parse_select()
+        if curr_type in self.SELECT_START_TOKENS:
+            # Statements are overwhelmingly queries, so skip the doomed
+            # expression parse and go straight to the SELECT machinery.
+            expression = self._parse_select()
+        else:
+            expression = self._parse_expression()
+            expression = (
+                self._parse_set_operations(expression) if expression else self._parse_select()
+            )
 
         self._parse_query_modifiers(expression)
         return expression
@@ -1250,10 +1440,10 @@ class Parser(metaclass=_Parser):
         if default:
             self._match_text_seq("DATABLOCKSIZE")
             return self.expression(exp.DataBlocksizeProperty, default=True)
-        elif self._match_texts(("MIN", "MINIMUM")):
+        elif self._match_texts(self.DATABLOCKSIZE_MIN_TEXTS):
             self._match_text_seq("DATABLOCKSIZE")
             return self.expression(exp.DataBlocksizeProperty, min=True)
-        elif self._match_texts(("MAX", "MAXIMUM")):
+        elif self._match_texts(self.DATABLOCKSIZE_MAX_TEXTS):
             self._match_text_seq("DATABLOCKSIZE")
             return self.expression(exp.DataBlocksizeProperty, min=False)
 
@@ -1261,7 +1451,7 @@ class Parser(metaclass=_Parser):
         self._match(TokenType.EQ)
         size = self._parse_number()
         units = None
-        if self._match_texts(("BYTES", "KBYTES", "KILOBYTES")):
+        if self._match_texts(self.DATABLOCKSIZE_UNITS):
             units = self._prev.text
         return self.expression(exp.DataBlocksizeProperty, size=size, units=units)
 
@@ -1328,7 +1518,7 @@ class Parser(metaclass=_Parser):
 
         if self._match_text_seq("ACCESS"):
             lock_type = "ACCESS"
-        elif self._match_texts(("EXCL", "EXCLUSIVE")):
+        elif self._match_texts(self.EXCLUSIVE_TEXTS):
             lock_type = "EXCLUSIVE"
         elif self._match_text_seq("SHARE"):
             lock_type = "SHARE"
@@ -1370,7 +1560,7 @@ class Parser(metaclass=_Parser):
     def _parse_create_like(self) -> t.Optional[exp.Expression]:
         table = self._parse_table(schema=True)
         options = []
-        while self._match_texts(("INCLUDING", "EXCLUDING")):
+        while self._match_texts(self.CREATE_LIKE_TEXTS):
             this = self._prev.text.upper()
             id_var = self._parse_id_var()
 
@@ -1725,10 +1915,11 @@ class Parser(metaclass=_Parser):
                 break
 
         for key, parser in self.QUERY_MODIFIER_PARSERS.items():
-            expression = parser(self)
+            if self._curr_type in self.QUERY_MODIFIER_TOKENS[key]:
+                expression = parser(self)
 
-            if expression:
-                this.set(key, expression)
+                if expression:
+                    this.set(key, expression)
 
     def _parse_hint(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.HINT):
@@ -1893,6 +2084,9 @@ class Parser(metaclass=_Parser):
         )
 
     def _parse_join(self, skip_join_token: bool = False) -> t.Optional[exp.Expression]:
+        if not skip_join_token and self._curr_type not in self._join_start_tokens:
+            return None
+
         natural, side, kind = self._parse_join_side_and_kind()
 
         if not skip_join_token and not self._match(TokenType.JOIN):
@@ -2258,21 +2452,21 @@ class Parser(metaclass=_Parser):
             return limit_exp
 
         if self._match(TokenType.FETCH):
-            direction = self._match_set((TokenType.FIRST, TokenType.NEXT))
+            direction = self._match_set(self.FETCH_DIRECTIONS)
             direction = self._prev.text if direction else "FIRST"
             count = self._parse_number()
-            self._match_set((TokenType.ROW, TokenType.ROWS))
+            self._match_set(self.ROW_TOKENS)
             self._match(TokenType.ONLY)
             return self.expression(exp.Fetch, direction=direction, count=count)
 
         return this
 
     def _parse_offset(self, this: t.Optional[exp.Expression] = None) -> t.Optional[exp.Expression]:
-        if not self._match_set((TokenType.OFFSET, TokenType.COMMA)):
+        if not self._match_set(self.OFFSET_TOKENS):
             return this
 
         count = self._parse_number()
-        self._match_set((TokenType.ROW, TokenType.ROWS))
+        self._match_set(self.ROW_TOKENS)
         return self.expression(exp.Offset, this=this, expression=count)
 
     def _parse_lock(self) -> t.Optional[exp.Expression]:
@@ -2304,16 +2498,56 @@ class Parser(metaclass=_Parser):
         )
 
     def _parse_expression(self) -> t.Optional[exp.Expression]:
+        if self.memoize:
+            return self._memo_parse("expression", self._parse_expression_without_memo)
+        return self._parse_expression_without_memo()
+
+    def _parse_expression_without_memo(self) -> t.Optional[exp.Expression]:
         return self._parse_alias(self._parse_conjunction())
 
+    def _memo_parse(
+        self, rule: str, parse_method: t.Callable[[], t.Optional[exp.Expression]]
+    ) -> t.Optional[exp.Expression]:
+        key = (rule, self._index)
+        cached = self._memo.get(key)
+
+        if cached:
+            expression, index = cached
+            self._retreat(index)
+            return expression
+
+        expression = parse_method()
+        self._memo[key] = (expression, self._index)
+        return expression
+
     def _parse_conjunction(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_equality, self.CONJUNCTION)
+        return self._parse_binary(self._condition_precedence, self._parse_range)
 
     def _parse_equality(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_comparison, self.EQUALITY)
+        return self._parse_binary(self._condition_precedence, self._parse_range, min_prec=2)
 
-    def _parse_comparison(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_range, self.COMPARISON)
+    def _parse_binary(
+        self,
+        precedence: t.Dict[TokenType, t.Tuple[int, t.Type[exp.Expression]]],
+        parse_method: t.Callable,
+        min_prec: int = 1,
+    ) -> t.Optional[exp.Expression]:
+        this = parse_method()
+
+        while True:
+            op = precedence.get(self._curr_type)
+
+            if not op or op[0] < min_prec:
+                return this
+
+            prec, exp_class = op
+            self._advance()
+            this = self.expression(
+                exp_class,
+                this=this,
+                comments=self._prev_comments,
+                expression=self._parse_binary(precedence, parse_method, prec + 1),
+            )
 
     def _parse_range(self) -> t.Optional[exp.Expression]:
         this = self._parse_bitwise()
@@ -2404,15 +2638,31 @@ class Parser(metaclass=_Parser):
         return this
 
     def _parse_term(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_factor, self.TERM)
-
-    def _parse_factor(self) -> t.Optional[exp.Expression]:
-        return self._parse_tokens(self._parse_unary, self.FACTOR)
+        return self._parse_binary(self._arithmetic_precedence, self._parse_unary)
 
     def _parse_unary(self) -> t.Optional[exp.Expression]:
+        prefixes = None
+
+        while self._curr_type in self.UNARY_WRAPPERS:
+            exp_class = self.UNARY_WRAPPERS[self._curr_type]
+            self._advance()
+
+            if exp_class:
+                if prefixes is None:
+                    prefixes = [exp_class]
+                else:
+                    prefixes.append(exp_class)
+
         if self._match_set(self.UNARY_PARSERS):
-            return self.UNARY_PARSERS[self._prev.token_type](self)
-        return self._parse_at_time_zone(self._parse_type())
+            this = self.UNARY_PARSERS[self._prev.token_type](self)
+        else:
+            this = self._parse_at_time_zone(self._parse_type())
+
+        if prefixes:
+            for exp_class in reversed(prefixes):
+                this = self.expression(exp_class, this=this)
+
+        return this
 
     def _parse_type(self) -> t.Optional[exp.Expression]:
         if self._match(TokenType.INTERVAL):
@@ -2466,7 +2716,7 @@ class Parser(metaclass=_Parser):
         if not nested and self._match_pair(TokenType.L_BRACKET, TokenType.R_BRACKET):
             this = exp.DataType(
                 this=exp.DataType.Type.ARRAY,
-                expressions=[exp.DataType.build(type_token.value, expressions=expressions)],
+                expressions=[exp.DataType.build(type_token.name, expressions=expressions)],
                 nested=True,
             )
 
@@ -2493,9 +2743,9 @@ class Parser(metaclass=_Parser):
             if not self._match(TokenType.GT):
                 self.raise_error("Expecting >")
 
-            if self._match_set((TokenType.L_BRACKET, TokenType.L_PAREN)):
+            if self._match_set(self.TYPE_VALUES_L_TOKENS):
                 values = self._parse_csv(self._parse_conjunction)
-                self._match_set((TokenType.R_BRACKET, TokenType.R_PAREN))
+                self._match_set(self.TYPE_VALUES_R_TOKENS)
 
         value: t.Optional[exp.Expression] = None
         if type_token in self.TIMESTAMPS:
@@ -2532,7 +2782,7 @@ class Parser(metaclass=_Parser):
             return value
 
         return exp.DataType(
-            this=exp.DataType.Type[type_token.value.upper()],
+            this=exp.DataType.Type[type_token.name],
             expressions=expressions,
             nested=nested,
             values=values,
@@ -2556,9 +2806,14 @@ class Parser(metaclass=_Parser):
         return self.expression(exp.AtTimeZone, this=this, zone=self._parse_unary())
 
     def _parse_column(self) -> t.Optional[exp.Expression]:
+        # Bind the classes used per iteration to locals, replacing repeated
+        # module attribute lookups on one of the hottest parse paths.
+        column = exp.Column
+        literal = exp.Literal
+
         this = self._parse_field()
         if isinstance(this, exp.Identifier):
-            this = self.expression(exp.Column, this=this)
+            this = self.expression(column, this=this)
         elif not this:
             return self._parse_bracket(this)
         this = self._parse_bracket(this)
@@ -2575,9 +2830,9 @@ class Parser(metaclass=_Parser):
                 self._advance()
                 value = self._prev.text
                 field = (
-                    exp.Literal.number(value)
+                    literal.number(value)
                     if self._prev.token_type == TokenType.NUMBER
-                    else exp.Literal.string(value)
+                    else literal.string(value)
                 )
             else:
                 field = self._parse_star() or self._parse_function() or self._parse_id_var()
@@ -2590,8 +2845,8 @@ class Parser(metaclass=_Parser):
 
             if op:
                 this = op(self, this, field)
-            elif isinstance(this, exp.Column) and not this.table:
-                this = self.expression(exp.Column, this=field, table=this.this)
+            elif isinstance(this, column) and not this.table:
+                this = self.expression(column, this=field, table=this.this)
             else:
                 this = self.expression(exp.Dot, this=this, expression=field)
             this = self._parse_bracket(this)
@@ -2599,6 +2854,11 @@ class Parser(metaclass=_Parser):
         return this
 
     def _parse_primary(self) -> t.Optional[exp.Expression]:
+        if self.memoize:
+            return self._memo_parse("primary", self._parse_primary_without_memo)
+        return self._parse_primary_without_memo()
+
+    def _parse_primary_without_memo(self) -> t.Optional[exp.Expression]:
         if self._match_set(self.PRIMARY_PARSERS):
             token_type = self._prev.token_type
             primary = self.PRIMARY_PARSERS[token_type](self, self._prev)
@@ -2636,6 +2896,9 @@ class Parser(metaclass=_Parser):
             elif len(expressions) > 1:
                 this = self.expression(exp.Tuple, expressions=expressions)
             else:
+                # Paren is deliberately a real node rather than a flag on the
+                # child: the optimizer, the generator and helpers like unnest
+                # all dispatch on the node type.
                 this = self.expression(exp.Paren, this=this)
 
             if this and comments:
@@ -2654,7 +2917,7 @@ class Parser(metaclass=_Parser):
         if not self._curr:
             return None
 
-        token_type = self._curr.token_type
+        token_type = self._curr_type
 
         if self._match_set(self.NO_PAREN_FUNCTION_PARSERS):
             return self.NO_PAREN_FUNCTION_PARSERS[token_type](self)
@@ -2670,10 +2933,26 @@ class Parser(metaclass=_Parser):
             return None
 
         this = self._curr.text
-        upper = this.upper()
         self._advance(2)
 
-        parser = self.FUNCTION_PARSERS.get(upper)
+        if functions is None:
+            cached = self._function_cache.get(this)
+
+            if cached is None:
+                upper = this.upper()
+                cached = self._function_cache[this] = (
+                    self.FUNCTION_PARSERS.get(upper),
+                    self.FUNCTIONS.get(upper),
+                )
+
+            parser, function = cached
+        else:
+            upper = self._upper_cache.get(this)
+            if upper is None:
+                upper = self._upper_cache[this] = this.upper()
+
+            parser = self.FUNCTION_PARSERS.get(upper)
+            function = functions.get(upper)
 
         if parser:
             this = parser(self)
@@ -2685,10 +2964,6 @@ class Parser(metaclass=_Parser):
                 self._match_r_paren()
                 return this
 
-            if functions is None:
-                functions = self.FUNCTIONS
-
-            function = functions.get(upper)
             args = self._parse_csv(self._parse_lambda)
 
             if function:
@@ -2827,7 +3102,7 @@ class Parser(metaclass=_Parser):
 
         kind: exp.Expression
 
-        if self._match_set((TokenType.AUTO_INCREMENT, TokenType.IDENTITY)):
+        if self._match_set(self.GENERATED_KIND_TOKENS):
             start = None
             increment = None
 
@@ -2977,7 +3252,7 @@ class Parser(metaclass=_Parser):
         options = {}
 
         while self._match(TokenType.ON):
-            if not self._match_set((TokenType.DELETE, TokenType.UPDATE)):
+            if not self._match_set(self.FOREIGN_KEY_ON_TOKENS):
                 self.raise_error("Expected DELETE or UPDATE")
 
             kind = self._prev.text.lower()
@@ -2985,7 +3260,7 @@ class Parser(metaclass=_Parser):
             if self._match(TokenType.NO_ACTION):
                 action = "NO ACTION"
             elif self._match(TokenType.SET):
-                self._match_set((TokenType.NULL, TokenType.DEFAULT))
+                self._match_set(self.FOREIGN_KEY_SET_TOKENS)
                 action = "SET " + self._prev.text.upper()
             else:
                 self._advance()
@@ -3003,7 +3278,7 @@ class Parser(metaclass=_Parser):
         return self.expression(exp.PrimaryKey, expressions=expressions, options=options)
 
     def _parse_bracket(self, this: t.Optional[exp.Expression]) -> t.Optional[exp.Expression]:
-        if not self._match_set((TokenType.L_BRACKET, TokenType.L_BRACE)):
+        if not self._match_set(self.BRACKET_TOKENS):
             return this
 
         bracket_kind = self._prev.token_type
@@ -3195,7 +3470,7 @@ class Parser(metaclass=_Parser):
             position = self._prev.text.upper()
 
         expression = self._parse_term()
-        if self._match_set((TokenType.FROM, TokenType.COMMA)):
+        if self._match_set(self.TRIM_FROM_TOKENS):
             this = self._parse_term()
         else:
             this = expression
@@ -3262,7 +3537,7 @@ class Parser(metaclass=_Parser):
         window_alias = self._parse_id_var(any_token=False, tokens=self.WINDOW_ALIAS_TOKENS)
         partition = self._parse_partition_by()
         order = self._parse_order()
-        kind = self._match_set((TokenType.ROWS, TokenType.RANGE)) and self._prev.text
+        kind = self._match_set(self.WINDOW_FRAME_TOKENS) and self._prev.text
 
         if kind:
             self._match(TokenType.BETWEEN)
@@ -3297,15 +3572,18 @@ class Parser(metaclass=_Parser):
 
         return {
             "value": (
-                self._match_set((TokenType.UNBOUNDED, TokenType.CURRENT_ROW)) and self._prev.text
+                self._match_set(self.WINDOW_VALUE_TOKENS) and self._prev.text
             )
             or self._parse_bitwise(),
-            "side": self._match_set((TokenType.PRECEDING, TokenType.FOLLOWING)) and self._prev.text,
+            "side": self._match_set(self.WINDOW_SIDES) and self._prev.text,
         }
 
     def _parse_alias(
         self, this: t.Optional[exp.Expression], explicit: bool = False
     ) -> t.Optional[exp.Expression]:
+        if self._curr_type not in self._alias_start_tokens:
+            return this
+
         any_token = self._match(TokenType.ALIAS)
 
         if explicit and not any_token:
@@ -3430,7 +3708,11 @@ class Parser(metaclass=_Parser):
         parse_result = parse_method()
         items = [parse_result] if parse_result is not None else []
 
-        while self._match(sep):
+        # The separator match is inlined (TokenType members are singletons, so
+        # an identity check suffices) to keep the loop over long CSV lists tight.
+        while self._curr_type is sep:
+            self._advance()
+
             if parse_result and self._prev_comments:
                 parse_result.comments = self._prev_comments
 
@@ -3440,21 +3722,6 @@ class Parser(metaclass=_Parser):
 
         return items
 
-    def _parse_tokens(
-        self, parse_method: t.Callable, expressions: t.Dict
-    ) -> t.Optional[exp.Expression]:
-        this = parse_method()
-
-        while self._match_set(expressions):
-            this = self.expression(
-                expressions[self._prev.token_type],
-                this=this,
-                comments=self._prev_comments,
-                expression=parse_method(),
-            )
-
-        return this
-
     def _parse_wrapped_id_vars(self) -> t.List[t.Optional[exp.Expression]]:
         return self._parse_wrapped_csv(self._parse_id_var)
 
@@ -3482,7 +3749,7 @@ class Parser(metaclass=_Parser):
         if self._match_texts(self.TRANSACTION_KIND):
             this = self._prev.text
 
-        self._match_texts({"TRANSACTION", "WORK"})
+        self._match_texts(self.TRANSACTION_TEXTS)
 
         modes = []
         while True:
@@ -3502,7 +3769,7 @@ class Parser(metaclass=_Parser):
         savepoint = None
         is_rollback = self._prev.token_type == TokenType.ROLLBACK
 
-        self._match_texts({"TRANSACTION", "WORK"})
+        self._match_texts(self.TRANSACTION_TEXTS)
 
         if self._match_text_seq("TO"):
             self._match_text_seq("SAVEPOINT")
@@ -3707,10 +3974,7 @@ class Parser(metaclass=_Parser):
         return None
 
     def _match(self, token_type, advance=True):
-        if not self._curr:
-            return None
-
-        if self._curr.token_type == token_type:
+        if self._curr_type == token_type:
             if advance:
                 self._advance()
             return True
@@ -3718,20 +3982,17 @@ class Parser(metaclass=_Parser):
         return None
 
     def _match_set(self, types):
-        if not self._curr:
-            return None
-
-        if self._curr.token_type in types:
+        if self._curr_type in types:
             self._advance()
             return True
 
         return None
 
     def _match_pair(self, token_type_a, token_type_b, advance=True):
-        if not self._curr or not self._next:
+        if not self._next:
             return None
 
-        if self._curr.token_type == token_type_a and self._next.token_type == token_type_b:
+        if self._curr_type == token_type_a and self._next.token_type == token_type_b:
             if advance:
                 self._advance(2)
             return True
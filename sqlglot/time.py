@@ -31,7 +31,7 @@ def format_time(
     trie = trie or new_trie(mapping)
     current = trie
     chunks = []
-    sym = None
+    sym: t.Optional[str] = None
 
     while end <= size:
         chars = string[start:end]
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import typing as t
-from enum import auto
+from enum import IntEnum, auto
 
-from sqlglot.helper import AutoName
 from sqlglot.trie import in_trie, new_trie
 
 
-class TokenType(AutoName):
+# An IntEnum rather than a str-valued Enum so that the token-type hashing and
+# comparisons the parser does on every decision run at C int speed.
+class TokenType(IntEnum):
     L_PAREN = auto()
     R_PAREN = auto()
     L_BRACKET = auto()
@@ -837,7 +838,11 @@ class Tokenizer(metaclass=_Tokenizer):
                 self._comments,
             )
         )
-        self._comments = []
+
+        # Only reallocate the comments list when this token actually captured
+        # comments; the common case shares one empty list across tokens.
+        if self._comments:
+            self._comments = []
 
         # If we have either a semicolon or a begin token before the command's token, we'll parse
         # whatever follows the command's token as a string
@@ -920,17 +925,22 @@ class Tokenizer(metaclass=_Tokenizer):
             while not self._end and self._chars(comment_end_size) != comment_end:
                 self._advance()
 
-            self._comments.append(self._text[comment_start_size : -comment_end_size + 1])  # type: ignore
+            comment = self._text[comment_start_size : -comment_end_size + 1]
             self._advance(comment_end_size - 1)
         else:
             while not self._end and self.WHITE_SPACE.get(self._peek) != TokenType.BREAK:  # type: ignore
                 self._advance()
-            self._comments.append(self._text[comment_start_size:])  # type: ignore
+            comment = self._text[comment_start_size:]
+
+        # Comment lists are rebound rather than mutated in place, because tokens
+        # without comments all reference the same empty list (see _add).
+        self._comments = self._comments + [comment]
 
         # Leading comment is attached to the succeeding token, whilst trailing comment to the preceding.
         # Multiple consecutive comments are preserved by appending them to the current comments list.
         if comment_start_line == self._prev_token_line:
-            self.tokens[-1].comments.extend(self._comments)
+            token = self.tokens[-1]
+            token.comments = token.comments + self._comments
             self._comments = []
 
         return True
@@ -164,6 +164,19 @@ class TestParser(unittest.TestCase):
         assert len(expressions) == 3
         assert expressions[1] is None
 
+    def test_memoize(self):
+        sql = """
+            SELECT
+              CASE WHEN a > 1 THEN b ELSE c END AS x,
+              SUM(d) OVER (PARTITION BY e ORDER BY f) AS y
+            FROM z
+            WHERE a IN (1, 2) AND b BETWEEN 1 AND 2; SELECT 1
+        """
+        self.assertEqual(
+            [e.sql() for e in parse(sql, memoize=True)],
+            [e.sql() for e in parse(sql)],
+        )
+
     def test_expression(self):
         ignore = Parser(error_level=ErrorLevel.IGNORE)
         self.assertIsInstance(ignore.expression(exp.Hint, expressions=[""]), exp.Hint)